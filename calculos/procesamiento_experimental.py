@@ -1,8 +1,45 @@
 import numpy as np
-import pandas as pd
 import os
-from scipy.optimize import curve_fit
-import matplotlib.pyplot as plt
+import functools
+from scipy.fft import next_fast_len, rfft, rfftfreq
+from scipy.optimize import brentq
+from scipy.signal import decimate
+
+# Optional FFTW backend: if pyfftw is installed, every scipy.fft call
+# (rfft here, and scipy.signal internally) runs on FFTW instead of pocketfft.
+try:
+    import scipy.fft
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft
+    scipy.fft.set_global_backend(pyfftw.interfaces.scipy_fft)
+    # Keep recent FFTW plans alive so repeated lengths skip the planning step
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+except ImportError:
+    pyfftw = None
+
+# Dedicated FFTW plans for the PSD, one per (stacked) padded shape. Every
+# trace of an experiment has the same length, so planning is paid once and later
+# transforms reuse the plan and its SIMD-aligned buffers.
+# FFTW_ESTIMATE on purpose: for these ~150k-sample traces FFTW_MEASURE spends
+# ~3 s timing candidates to save ~50 us per transform, which a session that
+# analyses a handful of traces never earns back. Extra threads do not help
+# at this size either.
+_fft_plans = {}
+
+def _get_fft_plan(shape):
+    """
+    Returns (input buffer, output buffer, FFTW plan) for a real FFT along
+    the last axis of an array of the given shape.
+    """
+    if shape not in _fft_plans:
+        in_arr = pyfftw.empty_aligned(shape, dtype='float32')
+        out_arr = pyfftw.empty_aligned(shape[:-1] + (shape[-1] // 2 + 1,),
+                                       dtype='complex64')
+        plan = pyfftw.FFTW(in_arr, out_arr,
+                           flags=('FFTW_ESTIMATE', 'FFTW_DESTROY_INPUT'))
+        _fft_plans[shape] = (in_arr, out_arr, plan)
+    return _fft_plans[shape]
 
 # Configuration and paths
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -10,8 +47,7 @@ BASE_DIR = os.path.dirname(CURRENT_DIR)
 DATA_DIR = os.path.join(BASE_DIR, 'datos_experimentales') 
 OUTPUT_DIR = os.path.join(BASE_DIR, 'resultados_imagenes')
 
-if not os.path.exists(OUTPUT_DIR):
-    os.makedirs(OUTPUT_DIR)
+os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 FILES = {
     'sx': os.path.join(DATA_DIR, 'datos_sx.dat'), 
@@ -19,91 +55,253 @@ FILES = {
     'calib': os.path.join(DATA_DIR, 'datos_calibracion.txt')
 }
 
+FS = 20000  # Sampling frequency of the QPD traces (Hz)
+
+PI2 = np.pi * np.pi
+
 def lorentzian(f, fc, D):
     """
     Theoretical Lorentzian Power Spectral Density (PSD) for a trapped bead.
     S(f) = D / (pi^2 * (fc^2 + f^2))
     """
-    return D / (np.pi**2 * (fc**2 + f**2))
+    # D / pi^2 is a scalar: fold it first so the array only sees one division
+    return (D / PI2) / (fc**2 + f**2)
+
+def fit_lorentzian(f, P, fs):
+    """
+    Least squares fit of log(S(f)) to log(P), returns (fc, D).
+
+    In log space the model is log(D) - log(pi^2 (fc^2 + f^2)), so for a fixed
+    fc the best D has a closed form: log(D) is just the mean of the residual
+    r = log(P) + log(pi^2 (fc^2 + f^2)). That leaves a 1-D problem in
+    u = log(fc). Its derivative is analytic,
+        d/du sum (r - <r>)^2 = 4 sum (r - <r>) fc^2 / (fc^2 + f^2),
+    so fc is found as the root of that gradient (Brent's method between
+    0.1 Hz and Nyquist) with no numerical differentiation at all.
+
+    The fit stays in log space on purpose: each periodogram bin scatters
+    around S(f) with an exponential distribution (relative error ~100%), and
+    a linear fit weighted by the noisy P itself (sigma=P) collapses fc to
+    ~0 Hz on the measured traces. Log space only shifts the residuals by a
+    known constant, E[log P] = log S - euler_gamma, which leaves fc alone
+    and is removed from D below, so D is the amplitude of S, not of the
+    geometric mean of the data.
+    """
+    f2 = f * f
+    g = np.log(P) + np.log(PI2)
+
+    def gradient(log_fc):
+        fc2 = np.exp(2 * log_fc)
+        denom = fc2 + f2
+        r = g + np.log(denom)
+        # The constant factor 4 does not move the root
+        return np.dot(r - r.mean(), fc2 / denom)
+
+    lo, hi = np.log(0.1), np.log(fs / 2)
+    if gradient(lo) * gradient(hi) > 0:
+        raise ValueError("fc is not bracketed between 0.1 Hz and Nyquist.")
+    log_fc = brentq(gradient, lo, hi, xtol=1e-10)
+
+    fc = np.exp(log_fc)
+    D = np.exp(np.mean(g + np.log(fc**2 + f2)) + np.euler_gamma)
+    return fc, D
 
 def calculate_psd_fft(signal, fs):
     """
     Computes the One-Sided Power Spectral Density (PSD) using FFT.
+
+    This is a rectangular-window periodogram. The signal is zero-padded to the
+    next length pocketfft handles efficiently (only factors 2, 3 and 5), so a
+    trace with a large prime factor does not fall back to the slow algorithm.
+    Padding only interpolates the spectrum on a finer frequency grid; the
+    normalization uses the real number of samples, so amplitudes are unchanged.
+
+    signal can also be a stack of traces, shape (n_traces, N): all of them
+    go through one batched transform along the last axis (which pocketfft
+    spreads over its worker threads) and psd has the same leading shape.
     """
-    N = len(signal)
+    N = signal.shape[-1]
+    M = next_fast_len(N, real=True)
     dt = 1.0 / fs
     
     # 1. Compute FFT (Fast Fourier Transform)
     # Returns complex numbers (Z = a + bi) containing Magnitude and Phase.
-    fft_vals = np.fft.fft(signal)
+    # The signal is real, so the negative half of the spectrum is just a mirror
+    # of the positive half. rfft only computes the non-redundant bins
+    # (0 ... fs/2), which halves the work and the memory of a full FFT.
+    if pyfftw is not None:
+        # Copy into the plan's aligned buffer and zero the padding
+        in_arr, fft_vals, plan = _get_fft_plan(signal.shape[:-1] + (M,))
+        in_arr[..., :N] = signal
+        in_arr[..., N:] = 0
+        plan()
+    else:
+        fft_vals = rfft(signal, n=M, axis=-1, workers=-1)
     
     # 2. Compute Power (Magnitude Squared)
     # |Z|^2 = a^2 + b^2. We square the Magnitude (Amplitude), not the sine wave itself.
     # Physically, this converts Amplitude into Energy or Power.
-    psd = (np.abs(fft_vals)**2) * dt / N
+    # Using a^2 + b^2 directly avoids the sqrt hidden inside np.abs.
+    # The DC bin (f = 0) is skipped from the start: after removing the mean it
+    # only holds numerical noise, and the Lorentzian fit needs f > 0.
+    # fft_vals is a scratch buffer (fresh, or the plan's output that the next
+    # transform overwrites anyway), so b^2 is squared in place and
+    # everything accumulates into a single output array (no temporaries).
+    spectrum = fft_vals[..., 1:]
+    psd = np.square(spectrum.real)
+    np.square(spectrum.imag, out=spectrum.imag)
+    psd += spectrum.imag
 
-    # 3. Convert to One-Sided Spectrum
+    # 3. Normalize and convert to One-Sided Spectrum
     # We multiply by 2 to satisfy Parseval's Theorem (Conservation of Energy).
     # Since we discard the negative half of the spectrum (which mirrors the positive half),
     # we must double the positive values to keep the total energy correct.
-    psd = psd * 2 
+    # For an even length the Nyquist bin (fs/2) has no mirror, so it is not doubled.
+    psd *= 2 * dt / N
+    if M % 2 == 0:
+        psd[..., -1] /= 2
     
     # 4. Get Frequency Bins
     # A 'bin center' is the specific frequency tested at that index.
     # Since we can't measure infinite frequencies, we chop the spectrum into discrete 'bins'.
-    freqs = np.fft.fftfreq(N, dt)
+    freqs = rfftfreq(M, dt)[1:]
     
-    # 5. Mask: Keep only positive frequencies
-    # We ignore negative values because they are just a mathematical mirror 
-    # for real-valued signals. They don't represent "negative time," just a phasor 
-    # rotating in the opposite direction.
-    mask = (freqs > 0)
-    
-    return freqs[mask], psd[mask]
+    return freqs, psd
+
+def _load_trace(path):
+    """
+    Loads the signal trace stored in a whitespace-separated .dat file.
+
+    The first parse goes through np.loadtxt (C tokenizer) and the selected
+    column is saved next to the source as '<file>.npy'. Later calls load the
+    binary copy directly, as long as it is newer than the .dat file.
+    Traces are kept in float32: the ADC resolution is far below float32
+    precision, and it halves the memory traffic of the whole pipeline.
+    """
+    cache_path = path + '.npy'
+    # One stat per file: a missing cache raises instead of a separate exists()
+    try:
+        cache_fresh = os.stat(cache_path).st_mtime_ns >= os.stat(path).st_mtime_ns
+    except OSError:
+        cache_fresh = False
+    if cache_fresh:
+        trace = np.load(cache_path, mmap_mode='r')
+        if trace.dtype == np.float32:
+            return trace
+
+    # Handle 1-column vs multi-column data formats.
+    # Peeking at the first line is enough to know the layout, so the parser
+    # only tokenizes the one column we keep (no 2-D array, no column copy).
+    with open(path, 'r') as f:
+        n_cols = len(f.readline().split())
+    col = 0 if n_cols == 1 else 1
+    trace = np.loadtxt(path, usecols=col, dtype=np.float32)
+
+    try:
+        np.save(cache_path, trace)
+    except OSError as e:
+        print(f"Warning: could not write cache '{cache_path}': {e}")
+    return trace
+
+def _center(trace, out=None):
+    """
+    Subtracts the mean of a trace (accumulated in float64, applied in float32).
+
+    With out given, the centered trace is written there (e.g. one row of a
+    stacked array). Otherwise a freshly parsed trace is our own array, so it
+    is centered in place with no second N-sample allocation, and a trace
+    coming from the .npy cache (a read-only memory map of the file) is
+    subtracted into a new array.
+    """
+    m = np.float32(trace.mean(dtype=np.float64))
+    if out is not None:
+        return np.subtract(trace, m, out=out)
+    if trace.flags.writeable:
+        trace -= m
+        return trace
+    return trace - m
 
 def read_metadata(filepath):
     """
     Reads temperature and radius from the calibration file.
+
+    The values sit in the header, on the line after the column titles, but
+    the file also carries the full averaged PSD (~3 MB). Only the first block
+    of bytes is read and searched for the key; more blocks are read only
+    while the key, or the end of the value line after it, is not there yet
+    (so a line cut at the block boundary is never parsed). splitlines()
+    copes with the '\r' line endings the acquisition software writes.
     """
     meta = {'T': 298.15, 'R': 1.0e-6} 
+    key = b"Temperature (K)"
     try:
-        with open(filepath, 'r', encoding='latin-1') as f:
-            lines = f.readlines()
-        for i, line in enumerate(lines):
-            if "Temperature (K)" in line:
-                parts = lines[i+1].strip().split('\t')
-                if len(parts) > 3: meta['T'] = float(parts[3])
-                if len(parts) > 4: meta['R'] = float(parts[4]) * 1e-6
+        lines = []
+        with open(filepath, 'rb') as f:
+            data = b''
+            while True:
+                block = f.read(65536)
+                data += block
+                i = data.find(key)
+                if i >= 0:
+                    lines = data[i:].splitlines(keepends=True)
+                    # Key line, value line and its line terminator
+                    if len(lines) > 2 or (len(lines) == 2 and lines[1].endswith((b'\r', b'\n'))):
+                        break
+                if not block: # End of file: parse whatever is there
+                    break
+        parts = lines[1].strip().split(b'\t') if len(lines) > 1 else []
+        if len(parts) > 3: meta['T'] = float(parts[3])
+        if len(parts) > 4: meta['R'] = float(parts[4]) * 1e-6
     except Exception as e: 
         print(f"Warning reading metadata: {e}. Using defaults.")
     return meta
 
-def process_and_save():
-    print(f"--- Starting Analysis (Direct FFT Method) ---")
-    
+def _file_signature(path):
+    """
+    (path, mtime_ns, size) of a file, or (path, None, None) if it is missing.
+    It changes whenever the file is rewritten, so it works as a cache key.
+    """
     try:
-        # Load Data
-        # Updated to 'sep' to avoid the FutureWarning
-        # We use regex r'\s+' to handle variable spaces/tabs
-        df_sx = pd.read_csv(FILES['sx'], sep=r'\s+', header=None)
-        df_sy = pd.read_csv(FILES['sy'], sep=r'\s+', header=None)
-        meta = read_metadata(FILES['calib'])
-        
-        # Handle 1-column vs 2-column data formats
-        raw_sx = df_sx.iloc[:, 0].values if df_sx.shape[1] == 1 else df_sx.iloc[:, 1].values
-        raw_sy = df_sy.iloc[:, 0].values if df_sy.shape[1] == 1 else df_sy.iloc[:, 1].values
-        
-    except Exception as e:
-        return {'error': f"Error loading data: {e}.\nCheck files in '{DATA_DIR}'."}
+        st = os.stat(path)
+    except OSError:
+        return (path, None, None)
+    return (path, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=4)
+def _analyze(sig_sx, sig_sy, sig_calib, fs):
+    """
+    Numeric part of the pipeline: load, PSD, Lorentzian fit and stiffness.
+
+    The result only depends on the input files and fs, so it is memoized on
+    the file signatures: opening the viewer again in the same session (or
+    calling process_and_save twice) reuses it, and editing any input file
+    changes its signature and triggers a fresh analysis. The returned arrays
+    are shared between calls, so they are marked read-only.
+    """
+    # Load Data (binary .npy cache after the first text parse)
+    raw_sx = _load_trace(sig_sx[0])
+    raw_sy = _load_trace(sig_sy[0])
+    meta = read_metadata(sig_calib[0])
 
     # Normalize Data (Zero Mean)
-    norm_x = raw_sx - np.mean(raw_sx)
-    norm_y = raw_sy - np.mean(raw_sy)
+    # Both axes are centered straight into the rows of one (2, N) array,
+    # so their PSDs come out of a single batched FFT. A stacked array needs
+    # equal lengths: if one acquisition file is shorter, both traces are
+    # trimmed to the common length (the few extra samples barely change
+    # the PSD, and both axes keep the same frequency grid).
+    n = min(len(raw_sx), len(raw_sy))
+    if len(raw_sx) != len(raw_sy):
+        print(f"Warning: traces differ in length ({len(raw_sx)} vs {len(raw_sy)}); "
+              f"using the first {n} samples of each.")
+    xy = np.empty((2, n), dtype=np.float32)
+    norm_x = _center(raw_sx[:n], out=xy[0])
+    norm_y = _center(raw_sy[:n], out=xy[1])
 
     # Calculate PSD
-    fs = 20000 
-    f_x, Pxx = calculate_psd_fft(norm_x, fs)
-    f_y, Pyy = calculate_psd_fft(norm_y, fs)
+    # Both traces share the frequency grid, so f_y is the same array as f_x
+    f_x, P = calculate_psd_fft(xy, fs)
+    f_y = f_x
+    Pxx, Pyy = P
 
     # Lorentzian Fitting
     mask_fit = (f_x > 2) & (f_x < 8000)
@@ -112,16 +310,9 @@ def process_and_save():
     p0_y = [50, np.mean(Pyy[(f_y > 2) & (f_y < 10)])]
     
     try:
-        # Added 'bounds' to prevent negative frequencies.
-        # bounds=([lower_fc, lower_D], [upper_fc, upper_D])
-        # We force fc and D to be positive (0 to infinity).
-        popt_x, _ = curve_fit(lambda f, fc, D: np.log(lorentzian(f, fc, D)), 
-                              f_x[mask_fit], np.log(Pxx[mask_fit]), 
-                              p0=p0_x, bounds=(0, np.inf))
-        
-        popt_y, _ = curve_fit(lambda f, fc, D: np.log(lorentzian(f, fc, D)), 
-                              f_y[mask_fit], np.log(Pyy[mask_fit]), 
-                              p0=p0_y, bounds=(0, np.inf))
+        # Log-space fit with D solved in closed form (1-D search in fc)
+        popt_x = fit_lorentzian(f_x[mask_fit], Pxx[mask_fit], fs)
+        popt_y = fit_lorentzian(f_y[mask_fit], Pyy[mask_fit], fs)
     except Exception as e:
         print(f"Warning: Curve fit failed ({e}). Using initial guess.")
         popt_x = p0_x
@@ -136,50 +327,122 @@ def process_and_save():
     
     kx = 2 * np.pi * gamma * fc_x
     ky = 2 * np.pi * gamma * fc_y
-    
-    kx_disp = kx * 1e6
-    ky_disp = ky * 1e6
 
-    # Plotting
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    # Trajectory for the animation, 10x fewer samples.
+    # A plain [::10] slice folds all the noise above fs/20 back into the band;
+    # decimate applies a zero-phase FIR anti-aliasing filter first and
+    # returns a new contiguous array instead of a strided view of the trace.
+    traj_x = decimate(norm_x, 10, ftype='fir', zero_phase=True)
+    traj_y = decimate(norm_y, 10, ftype='fir', zero_phase=True)
+
+    for arr in (f_x, Pxx, f_y, Pyy, traj_x, traj_y):
+        arr.setflags(write=False)
+
+    return {
+        'f_x': f_x, 'Pxx': Pxx, 'f_y': f_y, 'Pyy': Pyy,
+        'popt_x': tuple(popt_x), 'popt_y': tuple(popt_y),
+        'traj_x': traj_x, 'traj_y': traj_y,
+        'kx_display': kx * 1e6,
+        'ky_display': ky * 1e6,
+        'fc_x': fc_x, 'fc_y': fc_y
+    }
+
+# Frequencies where the fitted Lorentzian is drawn: 200 log-spaced points over
+# the visible range (1 Hz to Nyquist) are already a smooth curve at 150 dpi.
+_LOG_F_FIT = np.logspace(0, np.log10(FS / 2), 200)
+
+def plot_psd_axis(ax, f, P, popt, k_val, label_axis, fs):
+    """Draws the measured PSD of one axis with its Lorentzian fit."""
+    # The raw periodogram has ~10^5 points; rasterizing it turns that line
+    # into a single image in the saved file instead of a huge vector path.
+    ax.loglog(f, P, color='royalblue', alpha=0.5, lw=0.5, label='Raw FFT Data',
+              rasterized=True)
     
-    def plot_axis(ax, f, P, popt, k_val, label_axis):
-        ax.loglog(f, P, color='royalblue', alpha=0.5, lw=0.5, label='Raw FFT Data')
-        
-        f_fit = np.logspace(np.log10(min(f)), np.log10(max(f)), 500)
-        ax.loglog(f_fit, lorentzian(f_fit, *popt), 'r--', lw=2.5, 
-                  label=f'Fit ($f_c$={popt[0]:.1f}Hz)')
-        
-        ax.axvline(x=popt[0], color='orange', linestyle=':', lw=2)
-        
-        ax.set_title(f"Axis {label_axis}: $k \\approx {k_val:.2f}$ pN/$\\mu$m")
-        ax.set_xlabel('Frequency (Hz)')
-        if label_axis == 'X': ax.set_ylabel('PSD ($V^2/Hz$)')
-        ax.grid(True, which="both", alpha=0.3)
-        ax.legend()
-        ax.set_xlim(1, fs/2)
-
-    plot_axis(ax1, f_x, Pxx, popt_x, kx_disp, 'X')
-    plot_axis(ax2, f_y, Pyy, popt_y, ky_disp, 'Y')
-
-    plt.tight_layout()
-    plot_path = os.path.join(OUTPUT_DIR, 'analisis_psd_fft.png')
-    plt.savefig(plot_path, dpi=150)
+    # side='right' keeps the last point when f[-1] is exactly Nyquist (fs/2)
+    lo = np.searchsorted(_LOG_F_FIT, f[0])
+    hi = np.searchsorted(_LOG_F_FIT, f[-1], side='right')
+    f_fit = _LOG_F_FIT[lo:hi]
+    ax.loglog(f_fit, lorentzian(f_fit, *popt), 'r--', lw=2.5, 
+              label=f'Fit ($f_c$={popt[0]:.1f}Hz)')
     
-    print(f"SUCCESS: fc_x={fc_x:.2f}Hz, fc_y={fc_y:.2f}Hz")
+    ax.axvline(x=popt[0], color='orange', linestyle=':', lw=2)
     
-    return {
-        'fig': fig,
-        'traj_x': norm_x[::10], 
-        'traj_y': norm_y[::10],
+    ax.set_title(f"Axis {label_axis}: $k \\approx {k_val:.2f}$ pN/$\\mu$m")
+    ax.set_xlabel('Frequency (Hz)')
+    if label_axis == 'X': ax.set_ylabel('PSD ($V^2/Hz$)')
+    ax.grid(True, which="both", alpha=0.3)
+    ax.legend()
+    ax.set_xlim(1, fs/2)
+
+def process_and_save(generate_plot=True):
+    """
+    Runs the analysis of the experimental traces and returns a dict with
+    fc_x, fc_y, kx_display, ky_display and the decimated traj_x/traj_y,
+    or {'error': message} if the data cannot be loaded.
+
+    With generate_plot=True (default) it also draws the PSD figure, saves it
+    as resultados_imagenes/analisis_psd_fft.png and returns it under 'fig'.
+    Callers that only need the numbers pass generate_plot=False and skip
+    matplotlib entirely, which is most of the run time once the numeric
+    part is cached.
+    """
+    print(f"--- Starting Analysis (Direct FFT Method) ---")
+    
+    try:
+        res = _analyze(_file_signature(FILES['sx']),
+                       _file_signature(FILES['sy']),
+                       _file_signature(FILES['calib']),
+                       FS)
+    except Exception as e:
+        return {'error': f"Error loading data: {e}.\nCheck files in '{DATA_DIR}'."}
+
+    f_x, Pxx, popt_x = res['f_x'], res['Pxx'], res['popt_x']
+    f_y, Pyy, popt_y = res['f_y'], res['Pyy'], res['popt_y']
+    fc_x, fc_y = res['fc_x'], res['fc_y']
+    kx_disp, ky_disp = res['kx_display'], res['ky_display']
+    fs = FS
+
+    results = {
+        'traj_x': res['traj_x'], 
+        'traj_y': res['traj_y'],
         'kx_display': kx_disp,
         'ky_display': ky_disp,
         'fc_x': fc_x, 'fc_y': fc_y
     }
 
+    if generate_plot:
+        # Plotting
+        # Object-oriented Figure (no pyplot): matplotlib is only imported when a
+        # plot is actually drawn and no GUI backend is started for the PNG export
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(12, 5))
+        ax1, ax2 = fig.subplots(1, 2)
+
+        plot_psd_axis(ax1, f_x, Pxx, popt_x, kx_disp, 'X', fs)
+        plot_psd_axis(ax2, f_y, Pyy, popt_y, ky_disp, 'Y', fs)
+
+        fig.tight_layout()
+        plot_path = os.path.join(OUTPUT_DIR, 'analisis_psd_fft.png')
+        fig.savefig(plot_path, dpi=150)
+        results['fig'] = fig
+    
+    print(f"SUCCESS: fc_x={fc_x:.2f}Hz, fc_y={fc_y:.2f}Hz")
+    
+    return results
+
 if __name__ == '__main__':
     res = process_and_save()
     if 'error' in res:
         print(res['error'])
     else:
+        import matplotlib.pyplot as plt
+        fig = res['fig']
+        try:
+            plt.figure(fig)  # hand the standalone Figure to pyplot
+        except ValueError:
+            # Older matplotlib only shows figures that pyplot created itself:
+            # open a window of the same size and move the Figure onto its canvas
+            manager = plt.figure(figsize=fig.get_size_inches()).canvas.manager
+            manager.canvas.figure = fig
+            fig.set_canvas(manager.canvas)
         plt.show()
\ No newline at end of file
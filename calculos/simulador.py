@@ -5,9 +5,13 @@ and calculate the particle's trajectory.
 
 Supports both Harmonic (F = -kx) and Anharmonic modes 
 (using interpolated force maps from external files).
+The Harmonic mode uses the exact Ornstein-Uhlenbeck update instead, since
+its linear force has a closed-form solution.
 """
 
 import numpy as np
+from numba import njit, prange
+from scipy.signal import lfilter
 import sys
 import os
 
@@ -19,29 +23,187 @@ sys.path.append(parent_dir)
 from utils import parametros as p
 from utils import lector_datos
 
-def run_simulation(total_steps, dt, gamma, k_B, T, 
-                   k_x=None, k_y=None, 
-                   fx_interp=None, fy_interp=None):
+@njit(parallel=True, cache=True)
+def _run_ou_ensemble(alpha_x, alpha_y, sigma_x, sigma_y, buf):
     """
-    Runs a Brownian motion simulation in a 2D optical trap.
-    
+    Exact Ornstein-Uhlenbeck recursion for many independent trajectories.
+    buf is (n_traj, 2, N) filled with N(0,1) samples; each trajectory is
+    written over its own noise in place (sample i is read before it is
+    replaced by position i). prange spreads the trajectories over all cores.
+    """
+    for k in prange(buf.shape[0]):
+        x = 0.0
+        y = 0.0
+        buf[k, 0, 0] = x
+        buf[k, 1, 0] = y
+        for i in range(1, buf.shape[2]):
+            x = alpha_x * x + sigma_x * buf[k, 0, i]
+            y = alpha_y * y + sigma_y * buf[k, 1, i]
+            buf[k, 0, i] = x
+            buf[k, 1, i] = y
+
+@njit(inline='always')
+def _sample_force(fx_grid, fy_grid, x, y, x0, dx, y0, dy):
+    """
+    Bilinear interpolation of both force components on a uniform grid,
+    grid[i, j] at (x0 + i dx, y0 + j dy). The cell index and the weights are
+    computed once and shared by Fx and Fy (both maps use the same grid).
+    Outside the grid it returns (0, 0), like fill_value=0 in the force interpolators.
+    """
+    u = (x - x0) / dx
+    v = (y - y0) / dy
+    nx, ny = fx_grid.shape
+    if not (0.0 <= u <= nx - 1 and 0.0 <= v <= ny - 1):
+        return 0.0, 0.0
+    i = min(int(u), nx - 2)
+    j = min(int(v), ny - 2)
+    tu = u - i
+    tv = v - j
+    w00 = (1.0 - tu) * (1.0 - tv)
+    w01 = (1.0 - tu) * tv
+    w10 = tu * (1.0 - tv)
+    w11 = tu * tv
+    fx = (w00 * fx_grid[i, j] + w01 * fx_grid[i, j + 1]
+          + w10 * fx_grid[i + 1, j] + w11 * fx_grid[i + 1, j + 1])
+    fy = (w00 * fy_grid[i, j] + w01 * fy_grid[i, j + 1]
+          + w10 * fy_grid[i + 1, j] + w11 * fy_grid[i + 1, j + 1])
+    return fx, fy
+
+@njit(cache=True, nogil=True)
+def _run_anharmonic(dt, gamma, x0, dx, y0, dy, fx_grid, fy_grid, noise, out):
+    """
+    Euler-Maruyama loop of the Anharmonic mode, compiled to machine code.
+    The force map is read with _sample_force on its regular grid (in nm), so each
+    step is a few array reads instead of two interpolator calls from Python.
+    noise and out are (2, N): row 0 is X and row 1 is Y.
+    nogil lets the GUI keep running while a worker thread integrates.
+    """
+    x = out[0, 0]
+    y = out[1, 0]
+    for i in range(1, out.shape[1]):
+        x_nm = x * 1e9
+        y_nm = y * 1e9
+        force_x, force_y = _sample_force(fx_grid, fy_grid, x_nm, y_nm, x0, dx, y0, dy)
+        x += (force_x / gamma) * dt + noise[0, i]
+        y += (force_y / gamma) * dt + noise[1, i]
+        out[0, i] = x
+        out[1, i] = y
+
+def warm_up():
+    """
+    Compiles (or loads from the numba cache) the Anharmonic kernel by running
+    it on a tiny dummy map, so the first real simulation does not pay the JIT
+    compilation. The argument types match those of run_simulation_anharmonic.
+    The Harmonic mode needs nothing: it runs through lfilter.
+    """
+    grid = np.zeros((2, 2))
+    noise = np.zeros((2, 2))
+    _run_anharmonic(1.0, 1.0, 0.0, 1.0, 0.0, 1.0, grid, grid, noise, np.zeros((2, 2)))
+
+def _make_rng(seed):
+    """
+    Thermal-noise Generator for a seed (None, int or an existing Generator).
+
+    New generators use the SFC64 bit generator instead of default_rng's
+    PCG64: it has a smaller state and fills the (2, N) normal blocks ~20%
+    faster. A Generator passed in is used as is, so callers keep full
+    control of the stream.
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.Generator(np.random.SFC64(seed))
+
+def _ou_coefficients(k, dt, gamma, k_B, T):
+    """
+    (alpha, sigma) of the exact one-step update of a harmonic trap:
+        alpha = exp(-k dt / gamma),  sigma^2 = (k_B T / k) (1 - alpha^2)
+    expm1 keeps 1 - alpha^2 accurate when k dt / gamma is tiny, and k = 0
+    falls back to free diffusion, sigma^2 = 2 D dt.
+    """
+    if k == 0:
+        return 1.0, np.sqrt(2 * k_B * T / gamma * dt)
+    alpha = np.exp(-k * dt / gamma)
+    sigma = np.sqrt(k_B * T / k * -np.expm1(-2 * k * dt / gamma))
+    return alpha, sigma
+
+def run_simulation_harmonic_exact(total_steps, dt, gamma, k_B, T, k_x, k_y, seed=None):
+    """
+    Harmonic-trap simulation with the exact discretization of the
+    Ornstein-Uhlenbeck process instead of Euler-Maruyama.
+
+    For F = -kx the Langevin equation is linear, so the position after one
+    step dt is known exactly: it decays by alpha = exp(-k dt / gamma) and
+    gains a Gaussian kick of variance (k_B T / k)(1 - alpha^2). There is no
+    O(dt) integration error, and any dt gives the right statistics: the
+    variance is k_B T / k and the PSD is the same Lorentzian that
+    procesamiento_experimental fits, so larger steps (fewer total_steps)
+    are fine as long as fs = 1/dt stays well above the corner frequency.
+
+    seed (int or np.random.Generator, optional) fixes the thermal noise.
+
+    Returns:
+        np.ndarray: Trajectory matrix of shape (total_steps, 2).
+    """
+    alpha_x, sigma_x = _ou_coefficients(k_x, dt, gamma, k_B, T)
+    alpha_y, sigma_y = _ou_coefficients(k_y, dt, gamma, k_B, T)
+
+    # X and Y are stored as two contiguous rows (see run_simulation_anharmonic)
+    rng = _make_rng(seed)
+    noise = rng.standard_normal((2, total_steps))
+    noise[0] *= sigma_x
+    noise[1] *= sigma_y
+    noise[:, 0] = 0.0  # start at the trap center, (0, 0)
+
+    # x[i] = alpha * x[i-1] + noise[i] is a first-order IIR filter applied to
+    # the noise, so lfilter runs the whole recursion in C (no Python loop and
+    # no JIT compilation on the first call).
+    trajectory = np.empty((2, total_steps))
+    trajectory[0] = lfilter([1.0], [1.0, -alpha_x], noise[0])
+    trajectory[1] = lfilter([1.0], [1.0, -alpha_y], noise[1])
+    return trajectory.T
+
+def run_simulation_ensemble(n_traj, total_steps, dt, gamma, k_B, T, k_x, k_y, seed=None):
+    """
+    n_traj independent harmonic-trap trajectories (exact Ornstein-Uhlenbeck
+    update, as in run_simulation_harmonic_exact), e.g. to average PSDs or
+    put error bars on a fitted corner frequency.
+
+    The noise of every run is drawn from one Generator, and the compiled
+    kernel integrates the runs in parallel, turning that buffer into the
+    trajectories without a second allocation. seed works as in
+    run_simulation.
+
+    Returns:
+        np.ndarray: Trajectories of shape (n_traj, total_steps, 2).
+    """
+    alpha_x, sigma_x = _ou_coefficients(k_x, dt, gamma, k_B, T)
+    alpha_y, sigma_y = _ou_coefficients(k_y, dt, gamma, k_B, T)
+
+    rng = _make_rng(seed)
+    trajectories = rng.standard_normal((n_traj, 2, total_steps))
+    _run_ou_ensemble(alpha_x, alpha_y, sigma_x, sigma_y, trajectories)
+    return trajectories.transpose(0, 2, 1)
+
+def run_simulation_anharmonic(total_steps, dt, gamma, k_B, T, fx_interp, fy_interp,
+                              seed=None):
+    """
+    Anharmonic-trap simulation (Euler-Maruyama) on an interpolated force map.
+
     Args:
-        total_steps (int): Total simulation steps.
-        dt (float): Time step in seconds.
-        gamma (float): Drag coefficient (Stokes).
-        k_B (float): Boltzmann constant.
-        T (float): Temperature in Kelvin.
-        k_x, k_y (float, optional): Stiffness for Harmonic mode.
-        fx_interp, fy_interp (func, optional): Interpolator functions for Anharmonic mode.
-    
+        fx_interp, fy_interp (func): Interpolators of the force map (in nm).
+        seed (int or np.random.Generator, optional): Seed of the thermal noise.
+
     Returns:
         np.ndarray: Trajectory matrix of shape (total_steps, 2).
     """
 
     # 1. Initialize Trajectory Matrix
-    # I use a tuple (total_steps, 2) to define the shape: Rows = time, Cols = X/Y dimensions.
+    # Stored as (2, total_steps): Row 0 = X, Row 1 = Y, Cols = time. Each
+    # coordinate is then one contiguous array (the loop reads and writes it
+    # sequentially), and returning trajectory.T still gives callers the
+    # usual (total_steps, 2) matrix, with traj[:, 0] a contiguous view.
     # Pre-allocating with zeros is more efficient than appending to a list.
-    trajectory = np.zeros((total_steps, 2))
+    trajectory = np.zeros((2, total_steps))
     
     # 2. Calculate Stochastic Parameters
     # Einstein Relation: Connects the physical drag (gamma) to thermal jitter (Diffusion).
@@ -53,51 +215,97 @@ def run_simulation(total_steps, dt, gamma, k_B, T,
     # must be scaled by sqrt(2*D*dt) to match the physical diffusion rate.
     noise_magnitude = np.sqrt(2 * diffusion_coeff * dt)
 
-    # 3. Simulation Loop (Euler-Maruyama Method)
+    # 3. Thermal Noise for every step, drawn up front
+    # standard_normal generates a Normal Distribution N(0,1). Drawing the whole
+    # (2, total_steps) block in one call uses NumPy's vectorized Ziggurat
+    # sampler instead of two Python-level randn() calls per step, and the
+    # loop below only reads noise[:, i]. Column 0 is never used (start position).
+    rng = _make_rng(seed)
+    noise = rng.standard_normal((2, total_steps))
+    noise *= noise_magnitude
+
+    # 4. Force Map on a Regular Grid
+    # The CSV maps are sampled on a uniform grid, so the whole loop can run
+    # in the compiled kernel with a bilinear lookup. Interpolators that do
+    # not carry their sample points (plain Python functions) use the loop below.
+    malla_x = lector_datos.malla_regular(fx_interp)
+    malla_y = lector_datos.malla_regular(fy_interp)
+    if (malla_x is not None and malla_y is not None
+            and malla_x[:4] == malla_y[:4]):
+        x0, dx, y0, dy, fx_grid = malla_x
+        _run_anharmonic(dt, gamma, x0, dx, y0, dy, fx_grid, malla_y[4], noise, trajectory)
+        return trajectory.T
+
+    # 5. Simulation Loop (Euler-Maruyama Method)
     # Starting at index 1 because index 0 is initialized to (0,0) [Trap Center].
     for i in range(1, total_steps):
         
         # Current Position (Memory of the 'now' to calculate the 'next')
         # Even though the physics is Markovian (no memory), the solver needs the 
         # previous step's location to compute the forces acting on the bead.
-        x_prev, y_prev = trajectory[i-1]
+        x_prev, y_prev = trajectory[:, i-1]
         
         # --- A. Deterministic Force Calculation ---
-        if fx_interp is not None and fy_interp is not None:
-            # Mode: Anharmonic (Interpolated Force Map)
-            # The interpolator function (LinearNDInterpolator) expects coordinates in the 
-            # same units used in the CSV map. Based on the CFATA data, these are nanometers.
-            # I convert meters -> nm before passing to the function.
-            point_nm = [x_prev * 1e9, y_prev * 1e9]
-            
-            # Here, fx_interp is the 'tool' passed as an argument that calculates force.
-            force_x = fx_interp(point_nm)
-            force_y = fy_interp(point_nm)
-            
-        elif k_x is not None and k_y is not None:
-            # Mode: Harmonic (Linear Spring)
-            # F = -kx. The negative sign ensures the Restoring Force always points 
-            # towards the equilibrium center (0,0), regardless of the bead's direction.
-            force_x = -k_x * x_prev
-            force_y = -k_y * y_prev
-            
-        else:
-            raise ValueError("Simulation Error: You must provide either (k_x, k_y) "
-                             "for Harmonic mode or (fx_interp, fy_interp) for Anharmonic mode.")
+        # Mode: Anharmonic (Interpolated Force Map)
+        # The interpolator function (LinearNDInterpolator) expects coordinates in the 
+        # same units used in the CSV map. Based on the CFATA data, these are nanometers.
+        # I convert meters -> nm before passing to the function.
+        point_nm = [x_prev * 1e9, y_prev * 1e9]
+        
+        # Here, fx_interp is the 'tool' passed as an argument that calculates force.
+        # scipy interpolators return a 1-element array; .item() turns it
+        # into the scalar the trajectory element needs.
+        force_x = np.asarray(fx_interp(point_nm)).item()
+        force_y = np.asarray(fy_interp(point_nm)).item()
         
         # --- B. Stochastic Force Calculation (Thermal Noise) ---
-        # np.random.randn() generates a number from a Normal Distribution N(0,1).
-        # I multiply by noise_magnitude to scale it to the physical system.
-        random_force_x = noise_magnitude * np.random.randn()
-        random_force_y = noise_magnitude * np.random.randn()
+        # Pre-sampled above, already scaled by noise_magnitude.
+        random_force_x, random_force_y = noise[:, i]
 
         # --- C. Update Position (Langevin Equation) ---
         # x_new = x_old + (Drift_Velocity * dt) + (Random_Step)
         # where Drift_Velocity = Force / gamma
-        trajectory[i, 0] = x_prev + (force_x / gamma) * dt + random_force_x
-        trajectory[i, 1] = y_prev + (force_y / gamma) * dt + random_force_y
+        trajectory[0, i] = x_prev + (force_x / gamma) * dt + random_force_x
+        trajectory[1, i] = y_prev + (force_y / gamma) * dt + random_force_y
         
-    return trajectory
+    return trajectory.T
+
+def run_simulation(total_steps, dt, gamma, k_B, T, 
+                   k_x=None, k_y=None, 
+                   fx_interp=None, fy_interp=None, seed=None):
+    """
+    Runs a Brownian motion simulation in a 2D optical trap.
+
+    The mode is decided once from the arguments given, and the whole run is
+    handed to the specialized function of that mode.
+    
+    Args:
+        total_steps (int): Total simulation steps.
+        dt (float): Time step in seconds.
+        gamma (float): Drag coefficient (Stokes).
+        k_B (float): Boltzmann constant.
+        T (float): Temperature in Kelvin.
+        k_x, k_y (float, optional): Stiffness for Harmonic mode.
+        fx_interp, fy_interp (func, optional): Interpolator functions for Anharmonic mode.
+        seed (int or np.random.Generator, optional): Seed of the thermal noise.
+            The same seed reproduces the same trajectory; None draws fresh
+            entropy from the OS on every call.
+    
+    Returns:
+        np.ndarray: Trajectory matrix of shape (total_steps, 2).
+    """
+    if fx_interp is not None and fy_interp is not None:
+        return run_simulation_anharmonic(total_steps, dt, gamma, k_B, T, fx_interp, fy_interp,
+                                         seed=seed)
+
+    # Harmonic Mode: F = -kx is linear, so it has an exact solution and
+    # does not need the Euler-Maruyama loop (see run_simulation_harmonic_exact).
+    if k_x is not None and k_y is not None:
+        return run_simulation_harmonic_exact(total_steps, dt, gamma, k_B, T, k_x, k_y,
+                                             seed=seed)
+
+    raise ValueError("Simulation Error: You must provide either (k_x, k_y) "
+                     "for Harmonic mode or (fx_interp, fy_interp) for Anharmonic mode.")
 
 if __name__ == '__main__':
     
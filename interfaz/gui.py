@@ -6,6 +6,9 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import numpy as np
+import threading
+import importlib
+import time
 import sys
 import os
 
@@ -14,7 +17,6 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import (
     FigureCanvasTkAgg, NavigationToolbar2Tk
 )
-import matplotlib.animation as animation
 
 # --- INICIO DE SOLUCIÓN DE RUTA ---
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -22,7 +24,8 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 # --- FIN DE SOLUCIÓN DE RUTA ---
 
-from calculos import simulador
+# calculos.simulador no se importa aquí: trae numba y scipy.signal (~0.8 s).
+# App lo importa en segundo plano mientras se construye la ventana.
 from utils import parametros as p
 from utils import lector_datos
 from visualizacion import graficador
@@ -33,11 +36,22 @@ class App(ttk.Frame):
         super().__init__(master)
         self.pack(fill=tk.BOTH, expand=True)
 
+        # Importar (y precompilar) el simulador en otro hilo: la ventana aparece
+        # sin esperarlo, y si se pide simular antes de que termine, el import
+        # simplemente espera.
+        threading.Thread(target=self._preparar_simulador, daemon=True).start()
+
         # --- Estado de Simulación ---
         self.trajectory_data = None
-        self.animation = None
+        self.animation = None     # Paso de la trayectoria del siguiente frame (None = sin animación)
         self.is_running = False
         self.animation_step_size = 50
+        self._after_id = None     # Llamada pendiente de Tk para el siguiente frame
+        self._bg = None           # Fondo del eje ya renderizado (para el blit)
+        self._sim_thread = None   # Hilo que integra la trayectoria (None = inactivo)
+        self._sim_result = None   # (id, trayectoria o excepción) que deja el hilo
+        self._sim_id = 0          # Se incrementa para descartar simulaciones viejas
+        self._estado_controles = None # Último estado aplicado a los botones
         
         # --- Estado de Datos ---
         self.anharmonic_mode = tk.BooleanVar(value=False)
@@ -109,7 +123,8 @@ class App(ttk.Frame):
             state="readonly",
             values=["force", "intensity", "none"]
         )
-        # Mapeo de nombres amigables para el usuario
+        # Mapeo de nombres amigables para el usuario (mismo orden que _viz_codes)
+        self._viz_codes = ('force', 'intensity', 'none')
         self.combo_viz['values'] = ("Fuerza (Magnitud)", "Intensidad del Haz", "Ninguno")
         self.combo_viz.current(0) # Seleccionar el primero por defecto
         self.combo_viz.bind("<<ComboboxSelected>>", self.on_viz_change)
@@ -124,6 +139,10 @@ class App(ttk.Frame):
         self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
         toolbar = NavigationToolbar2Tk(self.canvas, plot_frame)
         toolbar.update()
+
+        # Cada dibujo completo (reset, zoom, cambio de tamaño de la ventana)
+        # vuelve a guardar el fondo que usa el blit de la animación.
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         
         self.reset_plot()
         self.update_gui_state()
@@ -141,10 +160,9 @@ class App(ttk.Frame):
 
     def get_viz_mode_internal(self):
         """Traduce la selección del Combobox a nuestros códigos internos."""
-        selection = self.combo_viz.get()
-        if selection == "Fuerza (Magnitud)": return 'force'
-        if selection == "Intensidad del Haz": return 'intensity'
-        return 'none'
+        # Por índice y no por texto: no depende de cómo se escriban las etiquetas.
+        # current() da -1 si no hay selección, que también cae en 'none'.
+        return self._viz_codes[self.combo_viz.current()]
 
     def load_force_map(self):
         filepath = filedialog.askopenfilename(filetypes=[("Archivos CSV", "*.csv")])
@@ -173,7 +191,8 @@ class App(ttk.Frame):
 
 
     def reset_plot(self):
-        if self.animation: self.animation.event_source.stop(); self.animation = None
+        self._stop_loop(); self.animation = None
+        self._sim_id += 1; self._sim_thread = None
         self.is_running = False; self.trajectory_data = None
         self.ax.clear()
         
@@ -185,17 +204,19 @@ class App(ttk.Frame):
             lim_nm=300
         )
 
-        self.line, = self.ax.plot([], [], 'o', markersize=6, color='royalblue', zorder=10)
-        self.trace, = self.ax.plot([], [], '-', lw=1, alpha=0.7, color='orange', zorder=9)
+        # animated=True: la partícula y el rastro no entran en el dibujo
+        # completo del eje, solo se pintan encima del fondo guardado.
+        self.line, = self.ax.plot([], [], 'o', markersize=6, color='royalblue', zorder=10, animated=True)
+        self.trace, = self.ax.plot([], [], '-', lw=1, alpha=0.7, color='orange', zorder=9, animated=True)
         self.ax.set_xlabel('X [nm]'); self.ax.set_ylabel('Y [nm]')
         self.ax.set_aspect('equal'); self.ax.grid(True, linestyle=':', alpha=0.5)
         self.ax.set_xlim(-300, 300); self.ax.set_ylim(-300, 300)
-        self.canvas.draw()
+        self._redibujar()
         self.update_gui_state()
 
     def start_simulation(self):
-        if self.animation and not self.is_running:
-            self.animation.resume()
+        if self.animation is not None and not self.is_running:
+            pass # Reanudar: el ciclo continúa desde el frame donde se pausó
         else:
             if self.trajectory_data is None or self.animation is None:
                 self.reset_plot()
@@ -208,64 +229,204 @@ class App(ttk.Frame):
                 print(f"Iniciando simulación: {mode.upper()}")
                 common = {'total_steps': p.total_steps, 'dt': p.dt, 'gamma': p.gamma, 'k_B': p.k_B, 'T': p.T}
                 if mode == 'anharmonic':
-                    traj = simulador.run_simulation(**common, fx_interp=self.fx_interp, fy_interp=self.fy_interp)
+                    kwargs = dict(common, fx_interp=self.fx_interp, fy_interp=self.fy_interp)
                 else:
-                    traj = simulador.run_simulation(**common, k_x=p.kappa_x, k_y=p.kappa_y)
-                self.trajectory_data = traj * 1e9
-                self.setup_animation()
+                    kwargs = dict(common, k_x=p.kappa_x, k_y=p.kappa_y)
+
+                # La integración corre en un hilo aparte para que la ventana
+                # siga respondiendo; _poll_simulation revisa cuándo terminó.
+                self._sim_id += 1
+                self._sim_result = None
+                self._sim_thread = threading.Thread(
+                    target=self._simulate, args=(self._sim_id, kwargs), daemon=True)
+                self._sim_thread.start()
+                self.update_gui_state()
+                self.after(50, self._poll_simulation, self._sim_id)
+                return
+        self._iniciar_reloj()
+        self.is_running = True
+        self.update_gui_state()
+        self._schedule_tick()
+
+    @staticmethod
+    def _preparar_simulador():
+        """Hilo de arranque: importa el simulador y compila su kernel de numba."""
+        simulador = importlib.import_module('calculos.simulador')
+        simulador.warm_up()
+
+    def _simulate(self, sim_id, kwargs):
+        """Corre en el hilo de trabajo: no debe tocar ningún widget de Tk."""
+        try:
+            from calculos import simulador
+            resultado = simulador.run_simulation(**kwargs)
+        except Exception as e:
+            resultado = e
+        # Un hilo de una corrida ya reiniciada no publica nada: si terminara
+        # después de la corrida nueva, pisaría su resultado
+        if sim_id == self._sim_id:
+            self._sim_result = (sim_id, resultado)
+
+    def _poll_simulation(self, sim_id):
+        """Corre en el hilo de Tk: recoge la trayectoria cuando el hilo termina."""
+        if sim_id != self._sim_id:
+            return # Se reinició mientras simulaba: se descarta este resultado
+        if self._sim_thread is not None and self._sim_thread.is_alive():
+            self.after(50, self._poll_simulation, sim_id)
+            return
+        if self._sim_result is None or self._sim_result[0] != sim_id:
+            # El resultado de esta corrida aún no está publicado
+            self.after(50, self._poll_simulation, sim_id)
+            return
+        self._sim_thread = None
+        _, traj = self._sim_result
+        self._sim_result = None
+        if isinstance(traj, Exception):
+            messagebox.showerror("Error", f"La simulación falló:\n{traj}")
+            self.update_gui_state()
+            return
+
+        # En float32: basta para posiciones en nm y matplotlib las pasa a Agg
+        # en precisión simple de todos modos; así cada frame mueve la mitad de bytes.
+        self.trajectory_data = np.multiply(traj, 1e9, dtype=np.float32)
+        # Cada eje en su propio arreglo contiguo: los cortes del rastro
+        # en animate_step son bloques de memoria seguidos.
+        self._tx = np.ascontiguousarray(self.trajectory_data[:, 0])
+        self._ty = np.ascontiguousarray(self.trajectory_data[:, 1])
+        self.setup_animation()
+        self._iniciar_reloj()
         self.is_running = True
         self.update_gui_state()
+        self._schedule_tick()
 
 
     def pause_simulation(self):
-        if self.animation and self.is_running:
-             self.animation.pause()
+        if self.animation is not None and self.is_running:
+             self._stop_loop()
              self.is_running = False
         self.update_gui_state()
 
     def reset_simulation(self):
-        if self.animation:
-            self.animation.event_source.stop()
-            self.animation = None
+        self._stop_loop()
+        self._sim_id += 1; self._sim_thread = None
+        self.animation = None
         self.is_running = False
         self.trajectory_data = None
         self.line.set_data([], [])
         self.trace.set_data([], [])
-        self.canvas.draw()
+        self._redibujar()
         self.update_gui_state()
         
     def setup_animation(self):
-        std_x, std_y = np.std(self.trajectory_data[:,0]), np.std(self.trajectory_data[:,1])
+        std_x, std_y = np.std(self._tx), np.std(self._ty) # Arreglos contiguos por eje
         lim = max(max(std_x, std_y, 10)*4, self.ax.get_xlim()[1])
         self.ax.set_xlim(-lim, lim); self.ax.set_ylim(-lim, lim)
-        self.animation = animation.FuncAnimation(self.fig, self.animate_step, 
-            frames=len(self.trajectory_data)//self.animation_step_size, interval=20, blit=True, repeat=False)
-        self.canvas.draw()
+        self.animation = 0
+        # Se leen una vez aquí y no en cada frame (get() de una variable de Tk pasa por Tcl)
+        self._trace_len = 2000 if self.anharmonic_mode.get() else 10000
+        # Velocidad de reproducción: animation_step_size pasos cada 20 ms
+        self._pasos_por_segundo = self.animation_step_size / 0.020
+        self._redibujar() # Dibujo completo: _on_draw guarda el fondo nuevo
+
+    # --- ANIMACIÓN (blit manual) ---
+    # En lugar de FuncAnimation, un ciclo con after() de Tk. El fondo del eje
+    # (mapa de fuerza/intensidad, ejes, rejilla) se renderiza una sola vez y
+    # se guarda; cada frame solo restaura ese fondo, dibuja la partícula y el
+    # rastro, y copia a la pantalla el rectángulo del eje.
+
+    def _redibujar(self):
+        """
+        Pide un dibujo completo del canvas sin bloquear: draw_idle lo deja
+        para cuando Tk esté libre, así varios cambios seguidos (reset_plot y
+        luego setup_animation) se juntan en un solo dibujo. Mientras tanto
+        el fondo guardado ya no es válido y _tick no hace blit.
+        """
+        self._bg = None
+        self.canvas.draw_idle()
+
+    def _on_draw(self, event):
+        """Guarda el fondo después de cada dibujo completo del canvas."""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.trace)
+        self.ax.draw_artist(self.line)
+
+    def _schedule_tick(self):
+        if self._after_id is None and self.is_running:
+            self._after_id = self.after(20, self._tick)
+
+    def _stop_loop(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
 
-    def animate_step(self, i):
-        step = i * self.animation_step_size
-        if step >= len(self.trajectory_data):
+    def destroy(self):
+        # Si se cierra con la animación corriendo, se cancela el frame ya
+        # programado (si no, Tk lo llamaría sobre un widget destruido)
+        self._stop_loop()
+        super().destroy()
+
+    def _tick(self):
+        self._after_id = None
+        if not self.is_running or self.animation is None:
+            return
+        # El paso a dibujar sale del reloj y no de contar frames: si un frame
+        # se atrasa (la máquina está ocupada), el siguiente salta directo al
+        # paso que corresponde en lugar de acumular el retraso, y la
+        # reproducción mantiene su velocidad con menos frames.
+        transcurrido = time.perf_counter() - self._t0
+        self.animation = int(transcurrido * self._pasos_por_segundo)
+        self.animate_step(self.animation)
+        if self._bg is not None:
+            self.canvas.restore_region(self._bg)
+            self.ax.draw_artist(self.trace)
+            self.ax.draw_artist(self.line)
+            self.canvas.blit(self.ax.bbox)
+        self._schedule_tick()
+
+    def _iniciar_reloj(self):
+        """Ajusta el reloj de la animación para seguir desde el paso actual (inicio o reanudación)."""
+        self._t0 = time.perf_counter() - self.animation / self._pasos_por_segundo
+
+    def animate_step(self, step):
+        line, trace, tx, ty = self.line, self.trace, self._tx, self._ty
+        if step >= len(tx):
             self.is_running = False; self.update_gui_state()
-            return self.line, self.trace
-        self.line.set_data([self.trajectory_data[step,0]], [self.trajectory_data[step,1]])
-        start = max(0, step - (2000 if self.anharmonic_mode.get() else 10000))
-        self.trace.set_data(self.trajectory_data[start:step,0], self.trajectory_data[start:step,1])
-        return self.line, self.trace
+            return line, trace
+        # Corte de longitud 1 en lugar de [x]: matplotlib recibe una vista, sin lista nueva
+        line.set_data(tx[step:step+1], ty[step:step+1])
+        start = max(0, step - self._trace_len)
+        # La pantalla no distingue más de ~1000 puntos en el rastro: tomamos
+        # uno de cada 'stride' para que Agg trace menos segmentos por frame.
+        stride = max(1, (step - start) // 1000)
+        trace.set_data(tx[start:step:stride], ty[start:step:stride])
+        return line, trace
+
+    # Estado de los controles según (simulando, animando, hay datos):
+    # (estado Iniciar, texto Iniciar, estado Pausar, estado Reiniciar, estado de la configuración)
+    _ESTADOS_CONTROLES = {
+        (True,  False, False): (tk.DISABLED, "Simulando...", tk.DISABLED, tk.NORMAL,   tk.DISABLED),
+        (False, True,  True):  (tk.DISABLED, "Iniciar",      tk.NORMAL,   tk.NORMAL,   tk.DISABLED),
+        (False, True,  False): (tk.DISABLED, "Iniciar",      tk.NORMAL,   tk.NORMAL,   tk.DISABLED),
+        (False, False, True):  (tk.NORMAL,   "Reanudar",     tk.DISABLED, tk.NORMAL,   tk.NORMAL),
+        (False, False, False): (tk.NORMAL,   "Iniciar",      tk.DISABLED, tk.DISABLED, tk.NORMAL),
+    }
 
     def update_gui_state(self):
-        sim_active = self.is_running
-        has_data = self.trajectory_data is not None
-        
-        self.btn_start.config(state=tk.DISABLED if sim_active else tk.NORMAL,
-                              text="Reanudar" if has_data and not sim_active else "Iniciar")
-        self.btn_pause.config(state=tk.NORMAL if sim_active else tk.DISABLED)
-        self.btn_reset.config(state=tk.NORMAL if (has_data or self.animation) else tk.DISABLED)
-        
-        state_settings = tk.DISABLED if sim_active else tk.NORMAL
-        self.check_anharmonic.config(state=state_settings)
-        self.btn_load.config(state=state_settings)
-        self.combo_viz.config(state="readonly" if not sim_active else tk.DISABLED)
+        simulating = self._sim_thread is not None
+        clave = (simulating, self.is_running and not simulating,
+                 self.trajectory_data is not None and not simulating)
+        estado = self._ESTADOS_CONTROLES[clave]
+        # Solo se reconfiguran los widgets si el estado cambió
+        if estado == self._estado_controles:
+            return
+        self._estado_controles = estado
+        start_state, start_text, pause_state, reset_state, settings_state = estado
 
+        self.btn_start.config(state=start_state, text=start_text)
+        self.btn_pause.config(state=pause_state)
+        self.btn_reset.config(state=reset_state)
+        self.check_anharmonic.config(state=settings_state)
+        self.btn_load.config(state=settings_state)
+        self.combo_viz.config(state="readonly" if settings_state == tk.NORMAL else tk.DISABLED)
 
 if __name__ == '__main__':
     print("Iniciando la aplicación GUI en modo de prueba...")
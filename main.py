@@ -3,8 +3,14 @@
 SUITE MAESTRA: Comparación Lado a Lado
 Izquierda: Simulación Teórica (Mie/Langevin)
 Derecha: Datos Experimentales (Lab)
+
+Uso:
+    python main.py         # Suite completa (simulación + experimento)
+    python main.py sim     # Solo el simulador
+    python main.py exp     # Solo el visor experimental
 """
 
+import argparse
 import tkinter as tk
 from tkinter import ttk
 import sys
@@ -14,9 +20,9 @@ import os
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
-# Importamos los módulos (que ahora son Frames)
-from interfaz import gui
-from visualizacion import visor_experimental
+# Los módulos de cada lado (que ahora son Frames) se importan hasta que se
+# necesitan: así 'sim' no carga el análisis experimental y 'exp' no carga
+# el simulador.
 
 class MainSuite(tk.Tk):
     def __init__(self):
@@ -53,6 +59,7 @@ class MainSuite(tk.Tk):
         paned_window.add(frame_left, weight=1) # weight=1 significa que crece
         
         # Instanciamos la GUI de simulación dentro del marco izquierdo
+        from interfaz import gui
         self.app_sim = gui.App(master=frame_left)
 
         # ==========================================
@@ -61,9 +68,52 @@ class MainSuite(tk.Tk):
         frame_right = ttk.LabelFrame(paned_window, text=" 📊 DATOS EXPERIMENTALES (Lab) ")
         paned_window.add(frame_right, weight=1)
         
-        # Instanciamos el Visor Experimental dentro del marco derecho
+        # Instanciamos el Visor Experimental dentro del marco derecho.
+        # Los dos lados están visibles a la vez, así que no se puede esperar a
+        # que el usuario elija uno; pero el visor carga y analiza los datos
+        # del laboratorio al construirse, así que lo creamos hasta que la
+        # ventana ya está en pantalla, en lugar de retrasar su aparición.
+        self.app_exp = None
+        self.lbl_cargando = ttk.Label(frame_right, text="Cargando datos experimentales...")
+        self.lbl_cargando.pack(expand=True)
+        # <Map> llega cuando el aviso de carga aparece en pantalla (se enlaza
+        # antes del mainloop, así que no se puede perder). Sin bloquear.
+        self._map_id = self.lbl_cargando.bind('<Map>', lambda e: self._al_mostrarse(frame_right))
+
+    def _al_mostrarse(self, frame_right):
+        # Una sola vez: se quita el enlace y se deja un momento para que Tk
+        # atienda los Expose y pinte el simulador y el aviso antes del análisis
+        self.lbl_cargando.unbind('<Map>', self._map_id)
+        self.update_idletasks()
+        self.after(50, self._construir_visor, frame_right)
+
+    def _construir_visor(self, frame_right):
+        self.lbl_cargando.destroy()
+        from visualizacion import visor_experimental
         self.app_exp = visor_experimental.ExperimentalViewer(master=frame_right)
 
+def main():
+    parser = argparse.ArgumentParser(description="Pinzas Ópticas: simulación y datos experimentales.")
+    parser.add_argument("modo", nargs="?", default="suite", choices=["suite", "sim", "exp"],
+                        help="suite: ambos lados (por defecto); sim: solo simulador; exp: solo experimento")
+    args = parser.parse_args()
+
+    if args.modo == "suite":
+        app = MainSuite()
+        app.mainloop()
+        return
+
+    root = tk.Tk()
+    root.geometry("1100x800")
+    if args.modo == "sim":
+        from interfaz import gui
+        root.title("Pinzas Ópticas: Simulación Teórica")
+        gui.App(master=root)
+    else:
+        from visualizacion import visor_experimental
+        root.title("Pinzas Ópticas: Datos Experimentales")
+        visor_experimental.ExperimentalViewer(master=root)
+    root.mainloop()
+
 if __name__ == "__main__":
-    app = MainSuite()
-    app.mainloop()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -3,18 +3,34 @@
 Módulo para cargar mapas de fuerza e intensidad desde archivos CSV.
 """
 
+import functools
+import os
 import numpy as np
-from scipy.interpolate import LinearNDInterpolator
 
 def cargar_mapa_fuerzas(filepath):
     """
     Carga un mapa desde un CSV. Soporta formato simple (4 cols) y completo (8 cols).
 
+    Los interpoladores se guardan en memoria según la ruta, la fecha de
+    modificación y el tamaño del archivo: volver a cargar el mismo mapa
+    (desde la interfaz o desde otro módulo) reutiliza la triangulación ya
+    construida, y si el archivo cambia se vuelve a leer.
+
     Returns:
         tuple: (fx_interp, fy_interp, int_interp)
                Devuelve interpoladores para Fuerza X, Fuerza Y, e Intensidad.
                Si el archivo no tiene intensidad, int_interp será None.
     """
+    try:
+        st = os.stat(filepath)
+        firma = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        firma = None
+    return _cargar_mapa(os.path.abspath(filepath), firma)
+
+@functools.lru_cache(maxsize=4)
+def _cargar_mapa(filepath, firma):
+    """Lectura real del mapa; firma solo sirve como parte de la llave del caché."""
     print(f"Cargando mapa desde: {filepath}")
     try:
         # Leemos saltando el encabezado
@@ -41,16 +57,108 @@ def cargar_mapa_fuerzas(filepath):
             raise ValueError(f"Formato de archivo desconocido ({num_cols} columnas).")
 
         # Crear interpoladores (fill_value=0.0 para que fuera del rango la fuerza sea 0)
-        fx_i = LinearNDInterpolator(points, values_Fx, fill_value=0.0)
-        fy_i = LinearNDInterpolator(points, values_Fy, fill_value=0.0)
+        # scipy.interpolate se importa hasta aquí (~0.25 s): la interfaz
+        # puede abrirse sin pagarlo hasta que se carga el primer mapa.
+        from scipy.interpolate import LinearNDInterpolator, RegularGridInterpolator
+        from scipy.spatial import Delaunay
+
+        # Los mapas exportados vienen en una malla rectangular: en ese caso
+        # RegularGridInterpolator ubica cada punto con aritmética de índices
+        # (sin triangulación de Delaunay). Si los puntos están dispersos, se
+        # usa la triangulación como antes, construida una sola vez y compartida
+        # por los tres interpoladores (así también se pueden evaluar juntos).
+        malla = _indices_malla(points)
+        if malla is not None:
+            xs, ys, i, j = malla
+            def crear(valores):
+                z = np.empty((len(xs), len(ys)))
+                z[i, j] = valores
+                return RegularGridInterpolator((xs, ys), z, bounds_error=False, fill_value=0.0)
+        else:
+            tri = Delaunay(points)
+            def crear(valores):
+                return LinearNDInterpolator(tri, valores, fill_value=0.0)
+
+        fx_i = crear(values_Fx)
+        fy_i = crear(values_Fy)
         
         int_i = None
         if values_Int is not None:
-             int_i = LinearNDInterpolator(points, values_Int, fill_value=0.0)
+             int_i = crear(values_Int)
 
         print("Interpoladores creados exitosamente.")
         return fx_i, fy_i, int_i
 
     except Exception as e:
         print(f"Error al cargar el mapa: {e}")
-        return None, None, None
\ No newline at end of file
+        return None, None, None
+
+def _indices_malla(puntos):
+    """
+    Revisa si los puntos (N, 2) forman una malla rectangular completa.
+
+    Returns:
+        tuple: (xs, ys, i, j) con los ejes ordenados y el índice de cada punto
+               en la malla (puntos[k] = (xs[i[k]], ys[j[k]])), o None si no.
+    """
+    xs = np.unique(puntos[:, 0])
+    ys = np.unique(puntos[:, 1])
+    if len(xs) < 2 or len(ys) < 2 or len(xs) * len(ys) != len(puntos):
+        return None
+    i = np.searchsorted(xs, puntos[:, 0])
+    j = np.searchsorted(ys, puntos[:, 1])
+    # Cada nodo debe aparecer exactamente una vez (sin puntos repetidos)
+    if np.unique(i * len(ys) + j).size != len(puntos):
+        return None
+    return xs, ys, i, j
+
+def malla_regular(interp):
+    """
+    Convierte un interpolador del mapa en una malla uniforme para los
+    kernels compilados del simulador.
+
+    Los mapas CSV ya vienen muestreados en una malla regular: con un
+    RegularGridInterpolator la malla se toma tal cual, y con un
+    LinearNDInterpolator se reconstruye a partir de sus puntos y valores.
+    Si la malla no es uniforme (o los puntos no forman una malla completa),
+    se remuestrea el interpolador una sola vez sobre una malla uniforme del
+    mismo tamaño aproximado.
+
+    Returns:
+        tuple: (x0, dx, y0, dy, valores) con valores[i, j] el valor en
+               (x0 + i*dx, y0 + j*dy), o None si interp no guarda sus puntos.
+    """
+    if hasattr(interp, 'grid') and hasattr(interp, 'values'):
+        # RegularGridInterpolator: ejes y valores ya ordenados en malla
+        xs, ys = interp.grid
+        malla = np.asarray(interp.values, dtype=float)
+        n = max(len(xs), len(ys))
+    elif hasattr(interp, 'points') and hasattr(interp, 'values'):
+        puntos = interp.points
+        valores = np.asarray(interp.values).reshape(len(puntos))
+        indices = _indices_malla(puntos)
+        if indices is not None:
+            xs, ys, i, j = indices
+            malla = np.zeros((len(xs), len(ys)))
+            malla[i, j] = valores
+        else:
+            xs = puntos[:, 0].min(), puntos[:, 0].max()
+            ys = puntos[:, 1].min(), puntos[:, 1].max()
+            malla = None
+        n = max(int(np.sqrt(len(puntos))), 2)
+    else:
+        return None
+
+    if malla is not None:
+        dx = (xs[-1] - xs[0]) / (len(xs) - 1)
+        dy = (ys[-1] - ys[0]) / (len(ys) - 1)
+        if np.allclose(np.diff(xs), dx) and np.allclose(np.diff(ys), dy):
+            return xs[0], dx, ys[0], dy, malla
+
+    # Malla no uniforme o puntos dispersos: una sola evaluación vectorizada
+    # sobre una malla uniforme
+    xg = np.linspace(xs[0], xs[-1], n)
+    yg = np.linspace(ys[0], ys[-1], n)
+    X, Y = np.meshgrid(xg, yg, indexing='ij')
+    malla = np.asarray(interp((X, Y)), dtype=float).reshape(n, n)
+    return xg[0], xg[1] - xg[0], yg[0], yg[1] - yg[0], malla
@@ -26,6 +26,11 @@ print("¡Trayectoria generada!")
 # Convertir de metros a nanómetros (1e9) 
 trajectory_nm = trajectory * 1e9
 
+# Cada eje en su propio arreglo contiguo: los cortes de cada frame son
+# bloques de memoria seguidos, sin saltar entre columnas.
+x_nm = np.ascontiguousarray(trajectory_nm[:, 0])
+y_nm = np.ascontiguousarray(trajectory_nm[:, 1])
+
 fig, ax = plt.subplots(figsize=(8, 8))
 
 # Punto que simula a la esfera
@@ -34,8 +39,8 @@ line, = ax.plot([], [], 'o', markersize=6, color='royalblue')
 trace, = ax.plot([], [], '-', lw=1, alpha=0.5, color='orange')
 
 def init():
-    std_dev_x = np.std(trajectory_nm[:, 0])
-    std_dev_y = np.std(trajectory_nm[:, 1])
+    std_dev_x = np.std(x_nm)
+    std_dev_y = np.std(y_nm)
     max_range = max(std_dev_x, std_dev_y, 10.0) * 4 
     
     ax.set_xlim(-max_range, max_range)
@@ -54,22 +59,21 @@ def init():
 def animate(i):
     step = i * 100
     
-    if step >= len(trajectory_nm):
+    if step >= len(x_nm):
         return line, trace
 
-    x_point = trajectory_nm[step, 0]
-    y_point = trajectory_nm[step, 1]
-    line.set_data([x_point], [y_point])
+    # Corte de longitud 1: matplotlib recibe una vista, sin lista nueva
+    line.set_data(x_nm[step:step+1], y_nm[step:step+1])
 
     start_trace = max(0, step - 1000)
-    x_trace = trajectory_nm[start_trace:step, 0]
-    y_trace = trajectory_nm[start_trace:step, 1]
+    x_trace = x_nm[start_trace:step]
+    y_trace = y_nm[start_trace:step]
     trace.set_data(x_trace, y_trace)
 
     return line, trace
 
 
-num_frames = len(trajectory_nm) // 100
+num_frames = len(x_nm) // 100
 
 print("Iniciando animación... (Esto puede tardar unos segundos)")
 
@@ -81,7 +85,8 @@ ani = animation.FuncAnimation(
     frames=num_frames,    # El número total de fotogramas a dibujar
     interval=20,          # Milisegundos entre fotogramas (50 fotogramas/seg)
     blit=True,            # blit=True es una optimización para animacion mucho más fluida
-    repeat=False          # No repetir la animación al terminar
+    repeat=False,         # No repetir la animación al terminar
+    cache_frame_data=False # No guardar los datos de cada frame ya mostrado
 )
 
 plt.show()
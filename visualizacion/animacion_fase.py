@@ -32,8 +32,16 @@ def animar_espacio_fase():
     )
     
     # Separamos componentes y convertimos a micras y m/s
-    x_um = traj[:-1, 0] * 1e6       
-    v_x = np.diff(traj[:, 0]) / p.dt 
+    x = traj[:, 0]
+    x_um = x[:-1] * 1e6       
+    # Velocidad por diferencias finitas: la resta se escribe en un solo
+    # arreglo nuevo y se escala ahí mismo, multiplicando por 1/dt
+    v_x = np.subtract(x[1:], x[:-1])
+    v_x *= 1.0 / p.dt
+
+    # Estado (x, v) de cada paso ya apilado: cada frame toma una fila
+    # como vista en lugar de armar una lista nueva para set_offsets
+    estados = np.column_stack((x_um, v_x))
     
     fig, ax = plt.subplots(figsize=(9, 7))
     
@@ -81,13 +89,14 @@ def animar_espacio_fase():
         i = frame * 10 
         if i >= len(x_um): return scatter, trail
         
-        scatter.set_offsets([[x_um[i], v_x[i]]])
+        scatter.set_offsets(estados[i:i+1])
         
         start = max(0, i - trail_len)
         trail.set_data(x_um[start:i], v_x[start:i])
         return scatter, trail
 
-    ani = animation.FuncAnimation(fig, update, frames=len(x_um)//10, interval=20, blit=True)
+    ani = animation.FuncAnimation(fig, update, frames=len(x_um)//10, interval=20, blit=True,
+                                  cache_frame_data=False)
     plt.show()
 
 if __name__ == "__main__":
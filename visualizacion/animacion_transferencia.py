@@ -63,23 +63,55 @@ def animar_transferencia():
 
     ax.legend(loc='upper right')
 
+    # Ventanas de Hann ya construidas, una por cada nperseg usado.
+    # Solo los primeros frames cambian de nperseg; después siempre es 2048,
+    # así que welch deja de reconstruir la misma ventana en cada frame.
+    ventanas = {}
+
+    # Welch promedia los periodogramas de segmentos de NPERSEG puntos con 50%
+    # de traslape. Cuando nperseg ya es fijo, cada frame solo añade segmentos
+    # nuevos al final del fragmento, así que calcular welch otra vez repite
+    # todas las FFT anteriores. En su lugar calculamos de una vez los
+    # periodogramas de todos los segmentos de la trayectoria (una FFT por
+    # lotes) y cada frame solo toma el promedio acumulado de los primeros.
+    NPERSEG = 2048
+    ventanas[NPERSEG] = signal.get_window('hann', NPERSEG)
+    f_seg, _, S_seg = signal.spectrogram(x_nm, fs, window=ventanas[NPERSEG],
+                                         nperseg=NPERSEG, noverlap=NPERSEG // 2,
+                                         mode='psd')
+    S_acumulado = np.cumsum(S_seg, axis=1)
+
+    # Empezamos con 2000 puntos y añadimos 1000 en cada frame. Los tamaños y
+    # sus textos se arman una vez aquí; cada frame solo los consulta.
+    N_FRAMES = 80
+    tamanos = [2000 + frame * 1000 for frame in range(N_FRAMES)]
+    textos = [f"Datos analizados: {n} puntos\n({n*p.dt:.2f} s)" for n in tamanos]
+
     def update(frame):
-        # Empezamos con 2000 puntos y añadimos 1000 en cada frame
-        window_size = 2000 + frame * 1000
+        window_size = tamanos[frame]
         
         if window_size > len(x_nm): return line_psd, txt_time
         
         fragmento = x_nm[:window_size]
         
         # Calcular PSD del fragmento actual
-        f, Pxx = signal.welch(fragmento, fs, nperseg=min(window_size//2, 2048))
+        nperseg = min(window_size//2, NPERSEG)
+        if nperseg == NPERSEG:
+            # Segmentos completos que caben en el fragmento (igual que welch)
+            n_seg = (window_size - NPERSEG) // (NPERSEG // 2) + 1
+            f, Pxx = f_seg, S_acumulado[:, n_seg - 1] / n_seg
+        else:
+            if nperseg not in ventanas:
+                ventanas[nperseg] = signal.get_window('hann', nperseg)
+            f, Pxx = signal.welch(fragmento, fs, window=ventanas[nperseg], nperseg=nperseg)
         
         line_psd.set_data(f, Pxx)
-        txt_time.set_text(f"Datos analizados: {window_size} puntos\n({window_size*p.dt:.2f} s)")
+        txt_time.set_text(textos[frame])
         
         return line_psd, txt_time
 
-    ani = animation.FuncAnimation(fig, update, frames=80, interval=100, blit=True)
+    ani = animation.FuncAnimation(fig, update, frames=N_FRAMES, interval=100, blit=True,
+                                  cache_frame_data=False)
     plt.show()
 
 if __name__ == "__main__":
@@ -45,37 +45,32 @@ def animar_intuicion_dft():
         ax.title.set_color('white')
         for spine in ax.spines.values(): spine.set_edgecolor('white')
 
-    magnitudes = []
+    # ECUACIÓN CLAVE DE LA DFT: e^(-i * 2pi * f * t)
+    # Enrollamos la señal alrededor del origen a cada frecuencia de prueba.
+    # Se calcula de una vez para las 400 frecuencias (una fila por frecuencia,
+    # 400x200 valores complejos) y cada frame solo toma su fila.
+    envueltas = senal * np.exp((-2j * np.pi) * np.multiply.outer(freqs_prueba, t))
+
+    # El valor de la Transformada es el PROMEDIO (Centro de Masa) de cada fila
+    centros = envueltas.mean(axis=1)
+    magnitudes = np.abs(centros)
     
     def update(frame):
         f_probe = freqs_prueba[frame]
-        
-        # ECUACIÓN CLAVE DE LA DFT: e^(-i * 2pi * f * t)
-        # Enrollamos la señal alrededor del origen a la frecuencia f_probe
-        vector_complejo = senal * np.exp(-1j * 2 * np.pi * f_probe * t)
-        
-        # Coordenadas para graficar
-        x_vals = np.real(vector_complejo)
-        y_vals = np.imag(vector_complejo)
-        
-        # El valor de la Transformada es el PROMEDIO (Centro de Masa)
-        center_x = np.mean(x_vals)
-        center_y = np.mean(y_vals)
-        magnitude = np.sqrt(center_x**2 + center_y**2)
-        
-        if len(magnitudes) <= frame:
-            magnitudes.append(magnitude)
+        vector_complejo = envueltas[frame]
+        center = centros[frame]
             
         # Dibujar
-        line_wrap.set_data(x_vals, y_vals)
-        dot_mass.set_data([center_x], [center_y])
+        line_wrap.set_data(vector_complejo.real, vector_complejo.imag)
+        dot_mass.set_data([center.real], [center.imag])
         
-        line_dft.set_data(freqs_prueba[:len(magnitudes)], magnitudes)
+        line_dft.set_data(freqs_prueba[:frame + 1], magnitudes[:frame + 1])
         vline_current.set_data([f_probe, f_probe], [0, 1])
         
         return line_wrap, dot_mass, line_dft, vline_current
 
-    ani = animation.FuncAnimation(fig, update, frames=len(freqs_prueba), interval=20, blit=True)
+    ani = animation.FuncAnimation(fig, update, frames=len(freqs_prueba), interval=20, blit=True,
+                                  cache_frame_data=False)
     plt.show()
 
 def animar_carrera_fft():
@@ -85,6 +80,17 @@ def animar_carrera_fft():
     # Complejidad Teórica
     ops_dft = N_vals**2             # O(N^2)
     ops_fft = N_vals * np.log2(N_vals) # O(N log N)
+
+    # Textos de cada N preparados de una vez (el 0.001 evita dividir entre
+    # cero en N = 1, donde log2(1) = 0); cada frame solo elige el suyo.
+    ratios = ops_dft / (ops_fft + 0.001)
+    textos = [
+        f"N = {n}\n"
+        f"Operaciones DFT: {int(dft)}\n"
+        f"Operaciones FFT: {int(fft)}\n"
+        f"FFT es {ratio:.1f}x más rápida aquí"
+        for n, dft, fft, ratio in zip(N_vals, ops_dft, ops_fft, ratios)
+    ]
     
     fig, ax = plt.subplots(figsize=(10, 6))
     fig.suptitle("La Diferencia Real: DFT vs FFT (Número de Operaciones)", fontsize=14, color='white')
@@ -125,18 +131,12 @@ def animar_carrera_fft():
             idx = frame - 1
             point_dft.set_data([N_vals[idx]], [ops_dft[idx]])
             point_fft.set_data([N_vals[idx]], [ops_fft[idx]])
-            
-            ratio = ops_dft[idx] / (ops_fft[idx] + 0.001)
-            txt_stats.set_text(
-                f"N = {N_vals[idx]}\n"
-                f"Operaciones DFT: {int(ops_dft[idx])}\n"
-                f"Operaciones FFT: {int(ops_fft[idx])}\n"
-                f"FFT es {ratio:.1f}x más rápida aquí"
-            )
+            txt_stats.set_text(textos[idx])
             
         return line_dft, line_fft, point_dft, point_fft, txt_stats
 
-    ani = animation.FuncAnimation(fig, update, frames=len(N_vals), interval=50, blit=True)
+    ani = animation.FuncAnimation(fig, update, frames=len(N_vals), interval=50, blit=True,
+                                  cache_frame_data=False)
     plt.show()
 
 if __name__ == "__main__":
@@ -1,20 +1,22 @@
+import functools
 import numpy as np
 import matplotlib.cm as cm
 from utils import parametros as p
 
-def draw_background(ax, viz_mode='force', anharmonic_mode=False, 
-                    fx_i=None, fy_i=None, int_i=None, lim_nm=300):
+@functools.lru_cache(maxsize=8)
+def _calcular_fondo(viz_mode, anharmonic_mode, fx_i, fy_i, int_i, lim_nm):
     """
-    Dibuja el mapa de fondo según el modo de visualización seleccionado.
+    Evalúa en una malla los valores (Z) del mapa de fondo.
 
-    Args:
-        viz_mode (str): 'force' (Magnitud de Fuerza) o 'intensity' (Intensidad del Haz).
-    """
-    if viz_mode == 'none':
-        return
+    Guardado en caché: cambiar de modo o de fondo y regresar a uno ya visto
+    no vuelve a evaluar los interpoladores en las 150x150 posiciones. Los
+    interpoladores entran a la llave por identidad, y cargar un mapa nuevo
+    crea objetos nuevos, así que nunca se reutiliza un fondo de otro mapa.
+    Los arreglos se devuelven de solo lectura porque se comparten.
 
-    print(f"Dibujando fondo: {viz_mode.upper()} (Modo sim: {'Anharmónico' if anharmonic_mode else 'Armónico'})")
-    
+    Returns:
+        tuple: (xx, yy, Z, cmap), o None si no hay nada que dibujar.
+    """
     grid_points = 150 # Mayor resolución para mejor visualización
     x = np.linspace(-lim_nm, lim_nm, grid_points)
     y = np.linspace(-lim_nm, lim_nm, grid_points)
@@ -33,23 +35,63 @@ def draw_background(ax, viz_mode='force', anharmonic_mode=False,
             cmap = cm.hot # 'hot' o 'inferno' son buenos para intensidad láser
         else:
             print("Aviso: Se pidió intensidad pero no hay datos disponibles.")
-            return
+            return None
 
     elif viz_mode == 'force':
         # --- MODO FUERZA ---
         cmap = cm.plasma # 'plasma' o 'jet' para fuerzas
         if anharmonic_mode and fx_i and fy_i:
             points = np.vstack((xx.ravel(), yy.ravel())).T
-            fx_map = fx_i(points).reshape(xx.shape)
-            fy_map = fy_i(points).reshape(xx.shape)
-            Z = np.sqrt(fx_map**2 + fy_map**2)
+            fx_map, fy_map = _evaluar_fuerza(fx_i, fy_i, points)
+            Z = np.hypot(fx_map, fy_map).reshape(xx.shape) # |F| en una pasada, sin temporales para los cuadrados
         else:
             # Fuerza Armónica (F = -kr)
-            # Convertir nm a m para el cálculo físico
-            fx_map = -p.kappa_x * (xx * 1e-9)
-            fy_map = -p.kappa_y * (yy * 1e-9)
-            Z = np.sqrt(fx_map**2 + fy_map**2)
-
-    # 3. Dibujar si tenemos datos (Z)
-    if Z is not None:
-        ax.contourf(xx, yy, Z, levels=25, cmap=cmap, alpha=0.7, zorder=1)
\ No newline at end of file
+            # |F| = sqrt((kx x)^2 + (ky y)^2); el signo no cambia la magnitud.
+            # El factor 1e-9 convierte nm a m para el cálculo físico.
+            Z = np.hypot(p.kappa_x * xx, p.kappa_y * yy)
+            Z *= 1e-9
+
+    if Z is None:
+        return None
+    for arr in (xx, yy, Z):
+        arr.flags.writeable = False
+    return xx, yy, Z, cmap
+
+def _evaluar_fuerza(fx_i, fy_i, points):
+    """
+    Evalúa Fx y Fy en los puntos (N, 2).
+
+    Si los dos interpoladores comparten la misma triangulación (mapas
+    dispersos cargados por lector_datos), se arma uno solo con valores
+    (Fx, Fy): cada punto se ubica en su triángulo una vez en lugar de dos.
+    Con RegularGridInterpolator la búsqueda ya es aritmética de índices y
+    se evalúan por separado.
+    """
+    tri = getattr(fx_i, 'tri', None)
+    if tri is not None and tri is getattr(fy_i, 'tri', None):
+        from scipy.interpolate import LinearNDInterpolator
+        valores = np.column_stack((np.ravel(fx_i.values), np.ravel(fy_i.values)))
+        F = LinearNDInterpolator(tri, valores, fill_value=0.0)(points)
+        return F[:, 0], F[:, 1]
+    return fx_i(points), fy_i(points)
+
+def draw_background(ax, viz_mode='force', anharmonic_mode=False, 
+                    fx_i=None, fy_i=None, int_i=None, lim_nm=300):
+    """
+    Dibuja el mapa de fondo según el modo de visualización seleccionado.
+
+    Args:
+        viz_mode (str): 'force' (Magnitud de Fuerza) o 'intensity' (Intensidad del Haz).
+    """
+    if viz_mode == 'none':
+        return
+
+    print(f"Dibujando fondo: {viz_mode.upper()} (Modo sim: {'Anharmónico' if anharmonic_mode else 'Armónico'})")
+    
+    datos = _calcular_fondo(viz_mode, anharmonic_mode, fx_i, fy_i, int_i, lim_nm)
+    if datos is None:
+        return
+    xx, yy, Z, cmap = datos
+
+    # 3. Dibujar (contourf queda fuera de la caché: crea artistas en este eje)
+    ax.contourf(xx, yy, Z, levels=25, cmap=cmap, alpha=0.7, zorder=1)
\ No newline at end of file
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-import matplotlib.animation as animation
+from matplotlib.figure import Figure
 import numpy as np
 import sys
 import os
@@ -25,7 +25,9 @@ class ExperimentalViewer(ttk.Frame):
         super().__init__(master)
         self.pack(fill=tk.BOTH, expand=True)
         self.data = None
-        self.animation = None
+        self.animation = None   # Frame actual de la animación (None = sin animación)
+        self._bg = None         # Fondo del eje ya renderizado (para el blit)
+        self._after_id = None   # Llamada pendiente de Tk para el siguiente frame
         
         self.run_analysis()
 
@@ -38,6 +40,8 @@ class ExperimentalViewer(ttk.Frame):
         tab_control.add(self.tab_analisis, text='Análisis PSD y Ajuste')
         
         tab_control.pack(expand=1, fill="both")
+        # La animación solo corre mientras su pestaña está a la vista
+        tab_control.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
         # --- 3. Construir Interfaz ---
         self.build_animation_tab()
@@ -49,7 +53,7 @@ class ExperimentalViewer(ttk.Frame):
         
         # Llamamos a la función principal del script de cálculo
         # Esta función carga los archivos, calcula el PSD y guarda la imagen
-        resultado = procesador.procesar_y_guardar()
+        resultado = procesador.process_and_save()
         
         if 'error' in resultado:
             messagebox.showerror("Error de Datos", 
@@ -79,7 +83,7 @@ class ExperimentalViewer(ttk.Frame):
             lbl.pack()
 
         # Lienzo de Matplotlib para la animación
-        self.fig_anim = procesador.plt.figure(figsize=(6, 6))
+        self.fig_anim = Figure(figsize=(6, 6))
         self.ax_anim = self.fig_anim.add_subplot(111)
         
         self.canvas_anim = FigureCanvasTkAgg(self.fig_anim, master=self.tab_anim)
@@ -88,6 +92,10 @@ class ExperimentalViewer(ttk.Frame):
         # Barra de herramientas (Zoom, Pan)
         toolbar = NavigationToolbar2Tk(self.canvas_anim, self.tab_anim)
         toolbar.update()
+
+        # Cada dibujo completo (inicio, zoom, cambio de tamaño) vuelve a
+        # guardar el fondo sobre el que se hace el blit de cada frame.
+        self.canvas_anim.mpl_connect('draw_event', self._on_draw)
         
         # Iniciar la animación si hay datos
         if self.data:
@@ -111,33 +119,74 @@ class ExperimentalViewer(ttk.Frame):
         self.ax_anim.set_xlim(-lim, lim)
         self.ax_anim.set_ylim(-lim, lim)
         
-        line, = self.ax_anim.plot([], [], 'o', color='cyan', markeredgecolor='blue', zorder=10, label='Partícula')
-        trace, = self.ax_anim.plot([], [], '.', color='darkviolet', alpha=0.5, zorder=5)
+        # animated=True: la partícula y el rastro no entran en el dibujo
+        # completo del eje, solo se pintan encima del fondo guardado.
+        self.line, = self.ax_anim.plot([], [], 'o', color='cyan', markeredgecolor='blue', zorder=10,
+                                       label='Partícula', animated=True)
+        self.trace, = self.ax_anim.plot([], [], '.', color='darkviolet', alpha=0.5, zorder=5,
+                                        animated=True)
         self.ax_anim.legend(loc='upper right')
-        
-        def update(frame):
-            step_size = 50
-            idx = frame * step_size
-            
-            if idx >= len(x_data): 
-                return line, trace
-            
-            line.set_data([x_data[idx]], [y_data[idx]])
-            
-            trace_len = 100
-            start = max(0, idx - trace_len)
-            trace.set_data(x_data[start:idx+1], y_data[start:idx+1])
-            
-            return line, trace
-            
-        self.ani = animation.FuncAnimation(
-            self.fig_anim, 
-            update, 
-            frames=len(x_data)//50, 
-            interval=20, 
-            blit=True,
-            repeat=True # Repetir al terminar
-        )
+
+        # En lugar de FuncAnimation, un ciclo con after() de Tk: el fondo
+        # (ejes, rejilla, leyenda) se renderiza una vez y cada frame solo
+        # restaura ese fondo, dibuja la partícula y el rastro, y hace blit.
+        self.animation = 0
+        self._bg = None
+        self.canvas_anim.draw_idle() # Al dibujarse, _on_draw guarda el fondo
+        self._schedule_tick()
+
+    def _on_draw(self, event):
+        """Guarda el fondo después de cada dibujo completo del canvas."""
+        self._bg = self.canvas_anim.copy_from_bbox(self.ax_anim.bbox)
+        if self.animation is not None:
+            self.ax_anim.draw_artist(self.trace)
+            self.ax_anim.draw_artist(self.line)
+
+    def _schedule_tick(self):
+        if self._after_id is None and self.animation is not None:
+            self._after_id = self.after(20, self._tick)
+
+    def _stop_loop(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _on_tab_changed(self, event):
+        """Pausa la animación al cambiar a otra pestaña y la retoma al volver."""
+        if str(event.widget.select()) == str(self.tab_anim):
+            self._schedule_tick()
+        else:
+            self._stop_loop()
+
+    def destroy(self):
+        # Al cerrar la ventana no debe quedar un frame pendiente apuntando a
+        # widgets que ya no existen
+        self._stop_loop()
+        super().destroy()
+
+    def _tick(self):
+        self._after_id = None
+        x_data = self.data['traj_x']
+        y_data = self.data['traj_y']
+        step_size = 50
+        idx = self.animation * step_size
+        if idx >= len(x_data): # Repetir al terminar
+            self.animation = idx = 0
+
+        # Corte de longitud 1: matplotlib recibe una vista, sin lista nueva
+        self.line.set_data(x_data[idx:idx+1], y_data[idx:idx+1])
+
+        trace_len = 100
+        start = max(0, idx - trace_len)
+        self.trace.set_data(x_data[start:idx+1], y_data[start:idx+1])
+        self.animation += 1
+
+        if self._bg is not None:
+            self.canvas_anim.restore_region(self._bg)
+            self.ax_anim.draw_artist(self.trace)
+            self.ax_anim.draw_artist(self.line)
+            self.canvas_anim.blit(self.ax_anim.bbox)
+        self._schedule_tick()
 
     def build_analysis_tab(self):
         """Construye la pestaña con la gráfica del PSD."""